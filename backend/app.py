@@ -1,20 +1,32 @@
 import streamlit as st
-import json
 import os
 import shutil
+import time
 import pandas as pd
 import plotly.express as px
 
-from model.resume_ranker import rank_resumes_combined
-from model.skill_extractor import extract_skills_from_text
+from model.candidate_pool import DEFAULT_POOL_FILE, load_pool, pool_candidates
+from model.job_catalog import load_job_catalog
+from model.reranker import (
+    BLEND_FUNCTIONS, DEFAULT_SKILL_WEIGHT, load_component_scores, rerank, save_component_scores,
+)
+from model.resume_ranker import normalize_skills, rank_candidates, rank_resumes_combined
+from model.skill_extractor import extract_skills_with_confidence
 from utils.pdf_parser import extract_text_from_pdf
 from utils.text_preprocessing import clean_and_lemmatize
+from utils.results_view import (
+    PARQUET_AVAILABLE, SORT_OPTIONS, add_ranks, export_csv, export_parquet,
+    filter_results, paginate, sort_results, to_table_rows, top_n,
+)
 
 # -------------------------------------------------------
 # 🧠 AI Resume Ranker + Skill Preview
 # Minor Project Final Version (Enhanced)
 # -------------------------------------------------------
 
+# Component scores of the most recent ranking (for re-weighting without reprocessing)
+LAST_RANKING_FILE = "last_ranking.json"
+
 # ---------- PAGE SETTINGS ----------
 st.set_page_config(
     page_title="AI Resume Ranker",
@@ -33,6 +45,177 @@ st.markdown(
     """
 )
 
+
+
+# ---------- CANDIDATE POOL ----------
+@st.cache_resource(max_entries=2, show_spinner="Loading candidate pool...")
+def cached_pool(pool_path, mtime_ns):
+    """
+    Unpickles the pool only when the watcher has rewritten it (mtime changed),
+    not on every rerun. Shared read-only across sessions.
+    """
+    return load_pool(pool_path)
+
+
+# ---------- RESULTS VIEW ----------
+def render_results(results, required_skills):
+    """
+    Scalable results view: instant re-weighting, filter + sort + paginated
+    table, per-candidate details on demand, aggregated charts and CSV / Parquet export.
+    """
+    st.subheader("📊 Resume Ranking Results")
+
+    # ---------- TUNE RANKING (NO REPROCESSING) ----------
+    with st.expander("⚖️ Tune Ranking Weights", expanded=False):
+        t1, t2 = st.columns(2)
+        skill_weight = t1.slider("Skill Match Weight", 0.0, 1.0, DEFAULT_SKILL_WEIGHT, 0.05, key="tune_skill_w")
+        t1.caption(f"TF-IDF Weight: {round(1 - skill_weight, 2)}")
+        blend = t2.selectbox("Blend Function", list(BLEND_FUNCTIONS), key="tune_blend",
+                             format_func=lambda b: BLEND_FUNCTIONS[b])
+        must_have = st.multiselect("Must-Have Skills", normalize_skills(required_skills), key="tune_must_have")
+
+    start = time.perf_counter()
+    results = add_ranks(rerank(results, skill_weight, 1 - skill_weight, blend, must_have))
+    st.caption(f"⚡ Re-ranked from cached component scores in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    if not results:
+        st.info("No candidates have all the must-have skills.")
+        return
+
+    # ---------- SUMMARY ----------
+    scores = [r["final_score"] for r in results]
+    m1, m2, m3 = st.columns(3)
+    m1.metric("Resumes Ranked", len(results))
+    m2.metric("Top Score", f"{max(scores)}%")
+    m3.metric("Average Score", f"{round(sum(scores) / len(scores), 2)}%")
+
+    # ---------- DUPLICATE GROUPS ----------
+    duplicate_groups = [r for r in results if r.get("duplicates")]
+    if duplicate_groups:
+        skipped = sum(len(r["duplicates"]) for r in duplicate_groups)
+        with st.expander(f"🧬 Near-Duplicate Groups ({len(duplicate_groups)} groups, {skipped} copies skipped)"):
+            for r in duplicate_groups:
+                st.write(f"**{r['file_name']}** (scored) ← {', '.join(r['duplicates'])}")
+
+    # ---------- FILTER / SORT ----------
+    f1, f2, f3, f4 = st.columns([3, 2, 2, 1])
+    name_query = f1.text_input("🔎 Filter by file name", key="res_query")
+    min_score = f2.slider("Minimum Final Score", 0, 100, 0, key="res_min_score")
+    sort_label = f3.selectbox("Sort by", list(SORT_OPTIONS.keys()), key="res_sort")
+    descending = f4.checkbox("Desc", value=True, key="res_desc")
+
+    view = filter_results(results, name_query, min_score)
+    view = sort_results(view, SORT_OPTIONS[sort_label], descending)
+
+    if not view:
+        st.info("No candidates match the current filters.")
+        return
+
+    # ---------- PAGINATED TABLE ----------
+    p1, p2 = st.columns([1, 1])
+    page_size = p1.selectbox("Rows per page", [25, 50, 100, 200], index=1, key="res_page_size")
+    page = p2.number_input("Page", min_value=1, value=1, step=1, key="res_page")
+    page_rows, total_pages = paginate(view, int(page), page_size)
+
+    st.caption(f"Page {min(int(page), total_pages)} of {total_pages} · showing {len(page_rows)} of "
+               f"{len(view)} matching candidates ({len(results)} ranked in total).")
+    st.dataframe(
+        pd.DataFrame(to_table_rows(page_rows)),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "final_score": st.column_config.ProgressColumn(
+                "Final Score", min_value=0, max_value=100, format="%.2f%%"),
+        },
+    )
+
+    # ---------- CANDIDATE DETAILS (ON DEMAND) ----------
+    selected_file = st.selectbox(
+        "📄 Show details for candidate",
+        [r["file_name"] for r in page_rows],
+        index=None,
+        placeholder="Choose a resume from this page...",
+        key="res_detail",
+    )
+    if selected_file:
+        res = next(r for r in page_rows if r["file_name"] == selected_file)
+        st.markdown(f"### 📄 {res['file_name']} (Rank #{res['rank']})")
+        st.progress(res["final_score"] / 100)
+        st.write(f"**Final Score:** {res['final_score']}%  "
+                 f"(Skill: {res['skill_score']}%, TF-IDF: {res['tfidf_score']}%)")
+        st.write(f"✅ **Matched Skills:** {', '.join(res['matched_skills']) or 'None'}")
+        st.write(f"❌ **Missing Skills:** {', '.join(res['missing_skills']) or 'None'}")
+        if res.get("duplicates"):
+            st.write(f"🧬 **Duplicate Copies (not scored):** {', '.join(res['duplicates'])}")
+        if res.get("fuzzy_matches"):
+            fuzzy_text = ", ".join(f"{s} ({round(c * 100)}%)" for s, c in res["fuzzy_matches"].items())
+            st.write(f"🔤 **Fuzzy Matches (confidence):** {fuzzy_text}")
+
+    # ---------- CHARTS ----------
+    st.subheader("📈 Match Percentage Overview")
+    c1, c2 = st.columns(2)
+    with c1:
+        fig = px.histogram(
+            x=[r["final_score"] for r in view],
+            nbins=20,
+            range_x=[0, 100],
+            labels={"x": "Match %"},
+            title="Score Distribution",
+        )
+        fig.update_layout(yaxis_title="Resumes")
+        st.plotly_chart(fig, use_container_width=True)
+    with c2:
+        top_count = st.slider("Top N candidates", 5, 50, 20, key="res_top_n")
+        best = top_n(view, top_count)
+        fig = px.bar(
+            x=[r["final_score"] for r in best],
+            y=[r["file_name"] for r in best],
+            orientation="h",
+            color=[r["final_score"] for r in best],
+            color_continuous_scale="Blues",
+            labels={"x": "Match %", "y": "Resume File", "color": "Match %"},
+            title=f"Top {len(best)} Candidates",
+        )
+        fig.update_layout(yaxis={"autorange": "reversed"})
+        st.plotly_chart(fig, use_container_width=True)
+
+    # ---------- EXPORT (BUILT ON DEMAND) ----------
+    # Exports are only built when asked for and cached for the current view,
+    # so filter / page / slider reruns never re-serialize the whole ranking.
+    export_key = (name_query, min_score, sort_label, descending,
+                  skill_weight, blend, tuple(must_have), len(view))
+    export = st.session_state.get("export_cache")
+    if export and export["key"] != export_key:
+        export = None
+
+    if export is None:
+        if st.button("📦 Prepare Export"):
+            export = {
+                "key": export_key,
+                "csv": export_csv(view),
+                "parquet": export_parquet(view) if PARQUET_AVAILABLE else None,
+            }
+            st.session_state["export_cache"] = export
+
+    if export is not None:
+        d1, d2 = st.columns(2)
+        d1.download_button(
+            label="📥 Download Results as CSV",
+            data=export["csv"],
+            file_name="resume_ranking_results.csv",
+            mime="text/csv",
+        )
+        if export["parquet"] is not None:
+            d2.download_button(
+                label="📥 Download Results as Parquet",
+                data=export["parquet"],
+                file_name="resume_ranking_results.parquet",
+                mime="application/octet-stream",
+            )
+
+    st.success("✅ Analysis Completed Successfully!")
+
+
 # ---------- TAB LAYOUT ----------
 tab1, tab2 = st.tabs(["🎯 Skill Preview", "📊 Resume Ranker"])
 
@@ -49,6 +232,7 @@ with tab1:
         accept_multiple_files=True,
         key="skill_preview"
     )
+    fuzzy_preview = st.checkbox("🔤 Fuzzy matching (catch misspelled skills like 'Pyhton')", key="fuzzy_preview")
 
     if uploaded_files_preview:
         temp_folder = "temp_skill_preview"
@@ -64,7 +248,7 @@ with tab1:
             # Extract text
             raw_text = extract_text_from_pdf(file_path)
             clean_text = clean_and_lemmatize(raw_text)
-            extracted_skills = extract_skills_from_text(raw_text)
+            extracted_skills = extract_skills_with_confidence(raw_text, fuzzy=fuzzy_preview)
 
             # ---------- DISPLAY ----------
             st.markdown(f"### 📄 {file.name}")
@@ -72,11 +256,13 @@ with tab1:
 
             if extracted_skills:
                 cols = st.columns(5)
-                for i, skill in enumerate(extracted_skills):
+                for i, skill in enumerate(sorted(extracted_skills)):
+                    confidence = extracted_skills[skill]
+                    label = skill if confidence == 1.0 else f"{skill} ({round(confidence * 100)}%)"
                     cols[i % 5].markdown(
                         f"<div style='padding:6px;background-color:#e0f2ff;"
                         f"border-radius:8px;text-align:center;margin:3px;"
-                        f"font-size:14px;color:#004c99;'>💡 {skill}</div>",
+                        f"font-size:14px;color:#004c99;'>💡 {label}</div>",
                         unsafe_allow_html=True
                     )
             else:
@@ -102,12 +288,8 @@ with tab2:
     st.write("Rank candidates using **Skill Matching + TF-IDF Similarity** for accurate results.")
 
     # ---------- JOB PROFILE SELECTION ----------
-    job_profile_path = os.path.join("backend", "model", "job_profiles.json")
-    if os.path.exists(job_profile_path):
-        with open(job_profile_path) as f:
-            job_profiles = json.load(f)
-    else:
-        job_profiles = {}
+    # Compiled once (and cached on disk); reruns reuse the in-process catalog
+    job_profiles = load_job_catalog()
 
     job_options = list(job_profiles.keys())
     selected_job = st.selectbox("🧩 Select Job Profile", job_options, index=None, placeholder="Choose a job profile...")
@@ -138,75 +320,94 @@ with tab2:
             )
 
 
-    uploaded_files_rank = st.file_uploader(
-        "Upload Resume PDFs for Ranking",
-        type=["pdf"],
-        accept_multiple_files=True,
-        key="rank_upload"
-    )
+    # ---------- RESUME SOURCE ----------
+    rank_source = st.radio("📂 Resume Source", ["Upload PDFs", "Watched Folder Pool"],
+                           horizontal=True, key="rank_source")
+
+    uploaded_files_rank = None
+    pool = {}
+    if rank_source == "Upload PDFs":
+        uploaded_files_rank = st.file_uploader(
+            "Upload Resume PDFs for Ranking",
+            type=["pdf"],
+            accept_multiple_files=True,
+            key="rank_upload"
+        )
+    else:
+        pool_path = st.text_input("Candidate Pool File", DEFAULT_POOL_FILE, key="rank_pool_path")
+        st.caption("Kept up to date by: `python backend/ingest_watcher.py <resume_folder> --pool "
+                   f"{pool_path}`")
+        pool_mtime_ns = os.stat(pool_path).st_mtime_ns if os.path.exists(pool_path) else 0
+        pool = cached_pool(pool_path, pool_mtime_ns)
+        if pool:
+            updated = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(pool_mtime_ns / 1e9))
+            st.info(f"🗂️ {len(pool)} preprocessed candidates in pool (last updated {updated}).")
+        else:
+            st.warning("⚠️ Candidate pool is empty or missing. Start the ingestion watcher first.")
+
+    fuzzy_rank = st.checkbox("🔤 Fuzzy skill matching (count misspelled / variant skills)", key="fuzzy_rank")
+    dedupe_rank = st.checkbox("🧬 Detect near-duplicate resumes (score one copy per candidate)",
+                              value=True, key="dedupe_rank")
 
     # ---------- ANALYZE ----------
     if st.button("🚀 Analyze & Rank"):
-        if not uploaded_files_rank:
+        if rank_source == "Upload PDFs" and not uploaded_files_rank:
             st.warning("⚠️ Please upload at least one resume.")
+        elif rank_source != "Upload PDFs" and not pool:
+            st.warning("⚠️ The candidate pool is empty.")
         elif not required_skills_input.strip():
             st.warning("⚠️ Please enter required skills before analyzing.")
         else:
             required_skills = [s.strip() for s in required_skills_input.split(",") if s.strip()]
-            temp_folder = "temp_resumes"
-
-            # Reset temp folder
-            if os.path.exists(temp_folder):
-                shutil.rmtree(temp_folder)
-            os.makedirs(temp_folder, exist_ok=True)
 
-            for file in uploaded_files_rank:
-                file_path = os.path.join(temp_folder, file.name)
-                with open(file_path, "wb") as f:
-                    f.write(file.read())
+            # Use the precompiled profile only if the recruiter didn't edit the prefilled text
+            job_profile = None
+            if (selected_job and required_skills_input == prefilled_skills_text
+                    and job_description_input == prefilled_description):
+                job_profile = job_profiles[selected_job]
 
             # ---------- RUN HYBRID RANKER ----------
-            results = rank_resumes_combined(required_skills, job_description_input, temp_folder)
+            if rank_source == "Upload PDFs":
+                temp_folder = "temp_resumes"
+
+                # Reset temp folder
+                if os.path.exists(temp_folder):
+                    shutil.rmtree(temp_folder)
+                os.makedirs(temp_folder, exist_ok=True)
+
+                for file in uploaded_files_rank:
+                    file_path = os.path.join(temp_folder, file.name)
+                    with open(file_path, "wb") as f:
+                        f.write(file.read())
+
+                results = rank_resumes_combined(required_skills, job_description_input, temp_folder,
+                                                job_profile=job_profile, fuzzy_skills=fuzzy_rank,
+                                                dedupe=dedupe_rank)
+                shutil.rmtree(temp_folder)
+            else:
+                # Pool is fully preprocessed: only skill matching + TF-IDF run here
+                results = rank_candidates(required_skills, job_description_input, pool_candidates(pool),
+                                          job_profile=job_profile, fuzzy_skills=fuzzy_rank,
+                                          dedupe=dedupe_rank)
 
-            if results:
-                st.subheader("📊 Resume Ranking Results")
-
-                for res in results:
-                    st.markdown(f"### 📄 {res['file_name']}")
-                    st.progress(res["final_score"] / 100)
-                    st.write(f"**Final Score:** {res['final_score']}%  "
-                             f"(Skill: {res['skill_score']}%, TF-IDF: {res['tfidf_score']}%)")
-                    st.write(f"✅ **Matched Skills:** {', '.join(res['matched_skills']) or 'None'}")
-                    st.write(f"❌ **Missing Skills:** {', '.join(res['missing_skills']) or 'None'}")
-                    st.markdown("---")
-
-                # ---------- BAR CHART ----------
-                df = pd.DataFrame(results)
-                st.subheader("📈 Match Percentage Comparison")
-                fig = px.bar(
-                    df,
-                    x="file_name",
-                    y="final_score",
-                    color="final_score",
-                    color_continuous_scale="Blues",
-                    text="final_score",
-                    labels={"file_name": "Resume File", "final_score": "Match %"},
-                )
-                fig.update_traces(texttemplate='%{text}%', textposition='outside')
-                st.plotly_chart(fig, use_container_width=True)
-
-                # ---------- CSV DOWNLOAD ----------
-                csv = df.to_csv(index=False).encode("utf-8")
-                st.download_button(
-                    label="📥 Download Results as CSV",
-                    data=csv,
-                    file_name="resume_ranking_results.csv",
-                    mime="text/csv",
-                )
-
-                st.success("✅ Analysis Completed Successfully!")
+            st.session_state["rank_results"] = results
+            st.session_state.pop("export_cache", None)
+            st.session_state["rank_required_skills"] = required_skills
 
+            if results:
+                # Persist component scores so the ranking can be re-weighted later
+                save_component_scores(results, LAST_RANKING_FILE, required_skills, job_description_input)
             else:
                 st.warning("⚠️ No resumes found or unable to extract text.")
 
-            shutil.rmtree(temp_folder)
+    # ---------- RESULTS VIEW ----------
+    # Results live in session state so paging / filtering / re-weighting reruns never reprocess.
+    if not st.session_state.get("rank_results") and os.path.exists(LAST_RANKING_FILE):
+        if st.button("📂 Load Last Ranking"):
+            candidates, saved_skills, _ = load_component_scores(LAST_RANKING_FILE)
+            st.session_state["rank_results"] = candidates
+            st.session_state.pop("export_cache", None)
+            st.session_state["rank_required_skills"] = saved_skills
+
+    if st.session_state.get("rank_results"):
+        render_results(st.session_state["rank_results"], st.session_state.get("rank_required_skills", []))
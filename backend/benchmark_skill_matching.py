@@ -0,0 +1,73 @@
+import os
+import sys
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.utils.pdf_parser import extract_text_from_pdf
+from backend.utils.text_preprocessing import apply_synonyms
+from backend.model.skill_extractor import (
+    get_fuzzy_index, load_skills, match_skills_exact, normalize_for_matching,
+)
+
+# -------------------------------------------------------
+# ⏱️ Exact vs Fuzzy Skill Matching Benchmark
+# Run:  python backend/benchmark_skill_matching.py [resume.pdf ...]
+# Without arguments a built-in sample resume text is used.
+# Text cleaning (spaCy) runs once per resume and is NOT part of the timings,
+# so the numbers compare the matching stages only.
+# -------------------------------------------------------
+
+SAMPLE_TEXT = """
+Data engineer with 4 years of experience in Pyhton, SQL and Apache Spark.
+Deployed Tensorflow2 and PyTorch models on Kubernates clusters using Docker.
+Built dashboards in Tableu and PowerBI, automated CI/CD with Jenkins and GitHub Actions.
+Strong background in machine lerning, data cleaning and statistical analysis.
+"""
+
+REPEATS = 20
+
+
+def _time_per_call(func, repeats=REPEATS):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = func()
+    return (time.perf_counter() - start) / repeats * 1000, result
+
+
+def benchmark(texts):
+    start = time.perf_counter()
+    get_fuzzy_index()
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"\n🔧 Fuzzy index built over {len(load_skills())} skills in {build_ms:.1f} ms\n")
+
+    exact_total = fuzzy_total = 0.0
+    for name, raw_text in texts:
+        text_lower, all_text_no_punct = normalize_for_matching(raw_text)
+        fuzzy_text = apply_synonyms(raw_text)
+
+        exact_ms, exact = _time_per_call(lambda: match_skills_exact(text_lower, all_text_no_punct))
+        fuzzy_ms, fuzzy = _time_per_call(
+            lambda: get_fuzzy_index().match_text(fuzzy_text, exclude=exact)
+        )
+        exact_total += exact_ms
+        fuzzy_total += fuzzy_ms
+
+        print(f"📄 {name}")
+        print(f"   Exact matcher : {exact_ms:7.2f} ms  ({len(exact)} skills)")
+        print(f"   Fuzzy stage   : {fuzzy_ms:7.2f} ms  (+{len(fuzzy)} skills: {fuzzy})\n")
+
+    count = len(texts)
+    print(f"--- Average per resume over {count} resume(s) ---")
+    print(f"Exact: {exact_total / count:.2f} ms | Fuzzy stage: {fuzzy_total / count:.2f} ms\n")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        resumes = [(os.path.basename(p), extract_text_from_pdf(p)) for p in sys.argv[1:] if os.path.exists(p)]
+    else:
+        resumes = [("sample text", SAMPLE_TEXT)]
+
+    if not resumes:
+        print("\n⚠️ None of the given PDF files exist.\n")
+    else:
+        benchmark(resumes)
@@ -0,0 +1,43 @@
+import argparse
+import os
+import sys
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from backend.model.candidate_pool import DEFAULT_POOL_FILE, ingest_folder, watch_folder
+
+# -------------------------------------------------------
+# 📥 Resume Drop-Folder Ingestion Daemon
+# Run:  python backend/ingest_watcher.py <resume_folder> [--pool candidate_pool.pkl]
+#       [--interval 5] [--workers 2] [--once]
+# New or changed PDFs (detected by mtime/size, confirmed by SHA-256) are
+# extracted, preprocessed and skill-tagged into the candidate pool, which
+# the Resume Ranker tab in app.py can rank directly.
+# -------------------------------------------------------
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch a folder and keep the candidate pool up to date.")
+    parser.add_argument("folder", help="Folder where resume PDFs arrive")
+    parser.add_argument("--pool", default=DEFAULT_POOL_FILE, help="Candidate pool file to update")
+    parser.add_argument("--interval", type=float, default=5.0, help="Seconds between folder scans")
+    parser.add_argument("--workers", type=int, default=2, help="Max parallel preprocessing workers")
+    parser.add_argument("--once", action="store_true", help="Run a single ingestion pass and exit")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.folder):
+        print(f"\n❌ Folder not found: {args.folder}\n")
+        return
+
+    if args.once:
+        summary = ingest_folder(args.folder, args.pool, max_workers=args.workers)
+        print(f"\n✅ Ingestion pass done: {summary}\n")
+        return
+
+    try:
+        watch_folder(args.folder, args.pool, args.interval, args.workers)
+    except KeyboardInterrupt:
+        print("\n👋 Watcher stopped.\n")
+
+
+if __name__ == "__main__":
+    main()
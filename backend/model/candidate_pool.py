@@ -0,0 +1,275 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+import hashlib
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from backend.model.resume_ranker import preprocess_resume
+from backend.utils.pdf_parser import extract_text_from_pdf
+
+# -------------------------------------------------------
+# 🗂️ AI Resume Ranker - Persisted Candidate Pool
+# Incremental ingestion of a watched resume folder
+# -------------------------------------------------------
+
+DEFAULT_POOL_FILE = "candidate_pool.pkl"
+
+# Bump whenever the stored record layout or preprocessing changes
+POOL_VERSION = 2
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """
+    SHA-256 of a file, read in chunks.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_pool(pool_path=DEFAULT_POOL_FILE):
+    """
+    Returns {file_name: record}. A missing, unreadable or outdated
+    pool file yields an empty pool (everything gets re-ingested).
+    """
+    return _load_payload(pool_path)["candidates"]
+
+
+def load_failures(pool_path=DEFAULT_POOL_FILE):
+    """
+    Returns {file_name: (mtime_ns, size, sha256)} of files whose ingestion
+    failed; they are not retried until their content changes.
+    """
+    return _load_payload(pool_path)["failed"]
+
+
+def _load_payload(pool_path):
+    try:
+        with open(pool_path, "rb") as f:
+            payload = pickle.load(f)
+        if payload.get("version") == POOL_VERSION:
+            return payload
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+    return {"candidates": {}, "failed": {}}
+
+
+def save_pool(candidates, pool_path=DEFAULT_POOL_FILE, failed=None):
+    """
+    Writes the pool atomically (temp file + rename), so readers such as
+    app.py never see a half-written pool while the watcher is updating it.
+    """
+    tmp_path = str(pool_path) + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump({"version": POOL_VERSION, "candidates": candidates, "failed": failed or {}}, f,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, pool_path)
+
+
+def pool_candidates(candidates):
+    """
+    Pool records in the form expected by resume_ranker.rank_candidates.
+    """
+    return [candidates[name] for name in sorted(candidates)]
+
+
+def process_resume_file(path):
+    """
+    Worker task: PDF extraction + full preprocessing for one file.
+    Fuzzy skill matches are always stored; rankings decide whether to count them.
+    """
+    raw_text = extract_text_from_pdf(path) or ""
+    return {"raw_text": raw_text, **preprocess_resume(raw_text, fuzzy_skills=True)}
+
+
+def plan_changes(folder, candidates, failed=None):
+    """
+    Compares the folder against the pool.
+
+    Returns (to_process, touched, removed):
+    - to_process: {file_name: (path, mtime_ns, size, sha256)} new or changed content
+    - touched: {file_name: (mtime_ns, size)} mtime/size changed but same content
+    - removed: pool entries whose file no longer exists
+
+    Files whose mtime and size are unchanged are not even hashed; files in
+    `failed` are skipped until their mtime, size or content changes.
+    """
+    to_process, touched = {}, {}
+    failed = failed or {}
+    seen = set()
+
+    for entry in os.scandir(folder):
+        if not (entry.is_file() and entry.name.lower().endswith(".pdf")):
+            continue
+        seen.add(entry.name)
+        record = candidates.get(entry.name)
+
+        try:
+            stat = entry.stat()
+            failure = failed.get(entry.name)
+            if failure and failure[:2] == (stat.st_mtime_ns, stat.st_size):
+                continue
+            if record and record["mtime_ns"] == stat.st_mtime_ns and record["size"] == stat.st_size:
+                continue
+            sha = file_sha256(entry.path)
+        except OSError as e:
+            # still being copied / removed meanwhile: pick it up on the next scan
+            print(f"[WARN] Could not read {entry.path}: {e}")
+            continue
+
+        if failure and failure[2] == sha:
+            failed[entry.name] = (stat.st_mtime_ns, stat.st_size, sha)
+        elif record and record["sha256"] == sha:
+            touched[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        else:
+            to_process[entry.name] = (os.path.abspath(entry.path), stat.st_mtime_ns, stat.st_size, sha)
+
+    removed = [name for name in candidates if name not in seen]
+    return to_process, touched, removed
+
+
+def _run_isolated(path):
+    """
+    Processes one file in its own single-worker process, so a worker crash
+    can be attributed to this file. Raises BrokenProcessPool if it crashes.
+    """
+    with ProcessPoolExecutor(max_workers=1) as isolated:
+        return isolated.submit(process_resume_file, path).result()
+
+
+def ingest_folder(folder, pool_path=DEFAULT_POOL_FILE, executor=None, max_workers=2, state=None):
+    """
+    One incremental ingestion pass: new / changed PDFs are preprocessed on a
+    bounded process pool, unchanged files are skipped and deleted files are
+    dropped. Files that fail are recorded (with mtime / size / sha256) and
+    not retried until they change. The pool file is rewritten only if
+    something changed.
+
+    If a worker dies (e.g. out of memory on a huge PDF) the executor breaks:
+    the files that were in flight are re-run one at a time in isolation to
+    find the culprit, and the summary reports "broken": True so a caller
+    passing its own executor knows to replace it.
+
+    `state` is the in-memory pool ({"candidates": ..., "failed": ...}, as
+    loaded by _load_payload) kept by a long-running caller; it is updated in
+    place. Without it the pool is read from `pool_path`.
+    Returns a summary dict with counts.
+    """
+    if state is None:
+        state = _load_payload(pool_path)
+    candidates, failed = state["candidates"], state["failed"]
+    failed_before = dict(failed)
+    to_process, touched, removed = plan_changes(folder, candidates, failed)
+
+    for name, (mtime_ns, size) in touched.items():
+        candidates[name] = {**candidates[name], "mtime_ns": mtime_ns, "size": size}
+    for name in removed:
+        del candidates[name]
+    for name in [n for n in failed if not os.path.exists(os.path.join(folder, n))]:
+        del failed[name]
+
+    newly_failed = []
+    processed = 0
+    crashed = []
+
+    def record(name, result=None, error=None):
+        nonlocal processed
+        path, mtime_ns, size, sha = to_process[name]
+        if error is not None:
+            print(f"[ERROR] Failed to ingest {path}\nReason: {error}")
+            failed[name] = (mtime_ns, size, sha)
+            newly_failed.append(name)
+            return
+        failed.pop(name, None)
+        processed += 1
+        candidates[name] = {
+            "file_name": name,
+            "path": path,
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "sha256": sha,
+            "ingested_at": time.time(),
+            **result,
+        }
+
+    if to_process:
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        try:
+            try:
+                futures = {executor.submit(process_resume_file, path): name
+                           for name, (path, _, _, _) in to_process.items()}
+            except BrokenProcessPool:
+                futures = {}
+                crashed = list(to_process)
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    record(name, result=future.result())
+                except BrokenProcessPool:
+                    # Not necessarily this file's fault: retried in isolation below
+                    crashed.append(name)
+                except Exception as e:
+                    record(name, error=e)
+        finally:
+            if own_executor:
+                executor.shutdown(wait=not crashed)
+
+        for name in crashed:
+            try:
+                record(name, result=_run_isolated(to_process[name][0]))
+            except Exception as e:
+                record(name, error=e)
+
+    if processed or newly_failed or touched or removed or failed != failed_before:
+        state["dirty"] = True
+    if state.get("dirty"):
+        # stays dirty if the write fails, so the next pass retries it
+        save_pool(candidates, pool_path, failed)
+        state["dirty"] = False
+
+    return {
+        "processed": processed,
+        "failed": len(newly_failed),
+        "touched": len(touched),
+        "removed": len(removed),
+        "total": len(candidates),
+        "broken": bool(crashed),
+    }
+
+
+def watch_folder(folder, pool_path=DEFAULT_POOL_FILE, interval=5.0, max_workers=2):
+    """
+    Polls `folder` every `interval` seconds and keeps the pool up to date.
+    The pool is loaded once and kept in memory between scans; the worker
+    pool is reused and recreated if a worker dies. A filesystem error during
+    a scan (folder unmounted, pool not writable, ...) is logged and the scan
+    is retried on the next interval. Runs until interrupted.
+    """
+    print(f"\n👀 Watching {folder} (every {interval}s, {max_workers} workers) -> {pool_path}\n")
+    state = _load_payload(pool_path)
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        while True:
+            try:
+                summary = ingest_folder(folder, pool_path, executor=executor, state=state)
+            except OSError as e:
+                print(f"[WARN] Scan of {folder} failed, retrying in {interval}s: {e}")
+                time.sleep(interval)
+                continue
+            if summary["broken"]:
+                print("[WARN] A worker process died; restarting the worker pool")
+                executor.shutdown(wait=False, cancel_futures=True)
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+            if summary["processed"] or summary["failed"] or summary["removed"]:
+                print(f"[INGEST] +{summary['processed']} processed, {summary['failed']} failed, "
+                      f"{summary['removed']} removed, {summary['total']} in pool")
+            time.sleep(interval)
+    finally:
+        executor.shutdown()
@@ -0,0 +1,123 @@
+import re
+import zlib
+from collections import defaultdict
+
+import numpy as np
+
+# -------------------------------------------------------
+# 🧬 AI Resume Ranker - Near-Duplicate Resume Detection
+# MinHash signatures over word shingles + LSH banding
+# -------------------------------------------------------
+
+SHINGLE_SIZE = 3        # words per shingle
+NUM_PERM = 128          # MinHash signature length
+BANDS = 16              # LSH bands (rows per band = NUM_PERM // BANDS = 8)
+THRESHOLD = 0.8         # estimated Jaccard similarity to call two resumes duplicates
+
+# Universal hashing modulo the Mersenne prime 2^31 - 1 keeps a * x + b inside uint64
+_PRIME = np.uint64((1 << 31) - 1)
+_rng = np.random.RandomState(42)
+_A = _rng.randint(1, (1 << 31) - 1, size=NUM_PERM).astype(np.uint64)
+_B = _rng.randint(0, (1 << 31) - 1, size=NUM_PERM).astype(np.uint64)
+
+
+def shingles(text, k=SHINGLE_SIZE):
+    """
+    Lowercased alphanumeric word k-shingles of the text, hashed to 32-bit
+    ints with crc32 (stable across processes, unlike hash()).
+    """
+    words = re.findall(r"[a-z0-9]+", (text or "").lower())
+    if len(words) < k:
+        grams = {" ".join(words)} if words else set()
+    else:
+        grams = {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)}
+    return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+
+
+def minhash_signature(shingle_hashes):
+    """
+    NUM_PERM-long MinHash signature, computed for all permutations at once.
+    Returns None for texts without shingles (they are never grouped).
+    """
+    if len(shingle_hashes) == 0:
+        return None
+    x = shingle_hashes % _PRIME
+    hashed = (_A[:, None] * x[None, :] + _B[:, None]) % _PRIME
+    return hashed.min(axis=1)
+
+
+def estimated_similarity(sig_a, sig_b):
+    """
+    Fraction of agreeing MinHash slots ≈ Jaccard similarity of the shingle sets.
+    """
+    return float(np.mean(sig_a == sig_b))
+
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def find_duplicate_groups(texts, threshold=THRESHOLD, bands=BANDS, signatures=None):
+    """
+    Groups near-duplicate documents.
+
+    texts: {name: text}
+    signatures: optional {name: MinHash signature} computed earlier (e.g.
+    stored in the candidate pool); only the missing ones are computed here.
+    Returns a list of groups (each a sorted list of names, size >= 2).
+
+    Signatures are bucketed per LSH band; only documents sharing a bucket are
+    compared, and each against the bucket's first member only, so the work
+    grows with the number of documents rather than the number of pairs.
+    """
+    names = sorted(texts)
+    known = signatures or {}
+    signatures = [known[n] if n in known else minhash_signature(shingles(texts[n])) for n in names]
+    rows = NUM_PERM // bands
+
+    parent = list(range(len(names)))
+    for band in range(bands):
+        buckets = defaultdict(list)
+        for i, sig in enumerate(signatures):
+            if sig is not None:
+                buckets[sig[band * rows:(band + 1) * rows].tobytes()].append(i)
+
+        for members in buckets.values():
+            head = members[0]
+            for other in members[1:]:
+                root_head, root_other = _find(parent, head), _find(parent, other)
+                if root_head == root_other:
+                    continue
+                if estimated_similarity(signatures[head], signatures[other]) >= threshold:
+                    parent[root_other] = root_head
+
+    groups = defaultdict(list)
+    for i, name in enumerate(names):
+        groups[_find(parent, i)].append(name)
+    return [g for g in groups.values() if len(g) > 1]
+
+
+def choose_representative(group, texts):
+    """
+    The copy to score for a group: the one with the most text
+    (usually the latest, most complete version), ties broken by name.
+    """
+    return min(group, key=lambda n: (-len(texts[n] or ""), n))
+
+
+# ------------------- TEST SECTION -------------------
+if __name__ == "__main__":
+    base = ("Data analyst skilled in Python, SQL, Power BI and Excel. Built dashboards, "
+            "cleaned data and trained machine learning models for sales forecasting. ") * 3
+    sample = {
+        "anurag.pdf": base,
+        "anurag_v2.pdf": base + "Certified in Tableau.",
+        "anurag (1).pdf": base,
+        "other.pdf": "Web developer with React, Node.js, MongoDB and Express.js experience.",
+    }
+    print("\n--- Near-Duplicate Groups ---\n")
+    for g in find_duplicate_groups(sample):
+        print(g, "-> keep:", choose_representative(g, sample))
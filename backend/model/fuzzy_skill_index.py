@@ -0,0 +1,156 @@
+import re
+from collections import defaultdict
+
+# -------------------------------------------------------
+# 🔤 AI Resume Ranker - Fuzzy Skill Index
+# Character n-gram candidate filtering + bounded edit distance
+# for misspelled / variant skills ("Pyhton", "Kubernates", "Tensorflow2")
+# -------------------------------------------------------
+
+# Skills shorter than this are never fuzzy-matched ("c", "r", "sql", "scala"...):
+# one edit on a short word is usually a different word, not a typo.
+MIN_FUZZY_LENGTH = 6
+
+# Confidence 1.0 is reserved for the exact matcher; fuzzy-stage hits
+# (even at edit distance 0) are capped below it so callers can tell them apart
+MAX_FUZZY_CONFIDENCE = 0.99
+
+# Resume tokens: words that may contain +, #, . (c++, c#, node.js)
+TOKEN_PATTERN = re.compile(r"[a-z][a-z0-9+#.]*")
+
+
+def max_edits_for(length):
+    """
+    Allowed edit distance for a term of the given length.
+    """
+    if length >= 10:
+        return 2
+    if length >= MIN_FUZZY_LENGTH:
+        return 1
+    return 0
+
+
+def char_ngrams(term, n=3):
+    """
+    Set of padded character n-grams, e.g. 'java' -> {'$ja', 'jav', 'ava', 'va$'}.
+    """
+    padded = f"${term}$"
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+def bounded_edit_distance(a, b, max_dist):
+    """
+    Optimal string alignment distance (Levenshtein + adjacent transpositions,
+    so 'pyhton' -> 'python' costs 1). Stops early and returns max_dist + 1
+    as soon as the distance is known to exceed max_dist.
+    """
+    if abs(len(a) - len(b)) > max_dist:
+        return max_dist + 1
+
+    prev_prev = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        row_min = cur[0]
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if (prev_prev is not None and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                cur[j] = min(cur[j], prev_prev[j - 2] + 1)
+            row_min = min(row_min, cur[j])
+        if row_min > max_dist:
+            return max_dist + 1
+        prev_prev, prev = prev, cur
+
+    return prev[-1]
+
+
+class FuzzySkillIndex:
+    """
+    Prebuilt n-gram index over the skill list.
+
+    A query term only gets compared (with bounded edit distance) against
+    skills sharing enough n-grams with it, so the cost per term depends on
+    the few posting lists it touches, not on the size of the skill list.
+    """
+
+    def __init__(self, skills, n=3):
+        self.n = n
+        self.skills = []
+        self.skill_grams = []
+        self.postings = defaultdict(list)
+
+        for skill in sorted(set(skills)):
+            if len(skill) < MIN_FUZZY_LENGTH:
+                continue
+            skill_id = len(self.skills)
+            grams = char_ngrams(skill, n)
+            self.skills.append(skill)
+            self.skill_grams.append(len(grams))
+            for gram in grams:
+                self.postings[gram].append(skill_id)
+
+        self.max_words = max((len(s.split()) for s in self.skills), default=1)
+
+    def lookup(self, term):
+        """
+        Returns (skill, confidence) for the closest indexed skill within the
+        allowed edit distance, or None. Confidence = 1 - distance / length,
+        capped at MAX_FUZZY_CONFIDENCE.
+        """
+        max_dist = max_edits_for(len(term))
+        if max_dist == 0:
+            return None
+
+        grams = char_ngrams(term, self.n)
+        shared = defaultdict(int)
+        for gram in grams:
+            for skill_id in self.postings.get(gram, ()):
+                shared[skill_id] += 1
+
+        best = None
+        for skill_id, count in shared.items():
+            # q-gram lemma: each edit destroys at most n grams
+            # (n + 1 for an adjacent transposition)
+            if count < max(len(grams), self.skill_grams[skill_id]) - (self.n + 1) * max_dist:
+                continue
+            skill = self.skills[skill_id]
+            # typos almost never hit the first letter; this also keeps
+            # unrelated words with similar endings out
+            if skill[0] != term[0]:
+                continue
+            dist = bounded_edit_distance(term, skill, max_dist)
+            if dist <= max_dist and (best is None or dist < best[1]):
+                best = (skill, dist)
+
+        if best is None:
+            return None
+        skill, dist = best
+        return skill, min(round(1 - dist / max(len(skill), len(term)), 2), MAX_FUZZY_CONFIDENCE)
+
+    def match_text(self, text_lower, exclude=(), min_confidence=0.8):
+        """
+        Fuzzy-matches every distinct word (and word n-gram, for multi-word
+        skills) of already-normalized text. Returns {skill: confidence}.
+        Skills in `exclude` (typically exact matches) are skipped.
+        """
+        words = [w.rstrip(".") for w in TOKEN_PATTERN.findall(text_lower)]
+        terms = set()
+        for size in range(1, self.max_words + 1):
+            for i in range(len(words) - size + 1):
+                terms.add(" ".join(words[i:i + size]))
+
+        matches = {}
+        for term in terms:
+            if term in exclude or len(term) < MIN_FUZZY_LENGTH:
+                continue
+            hit = self.lookup(term)
+            if not hit:
+                continue
+            skill, confidence = hit
+            if skill in exclude or confidence < min_confidence:
+                continue
+            if confidence > matches.get(skill, 0):
+                matches[skill] = confidence
+        return matches
@@ -0,0 +1,187 @@
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+import hashlib
+import json
+import pickle
+from pathlib import Path
+
+from backend.model.resume_ranker import job_text_for, normalize_skills, tfidf_tokens
+from backend.utils.text_preprocessing import clean_and_lemmatize
+
+# -------------------------------------------------------
+# 🧩 AI Resume Ranker - Precompiled Job Profile Catalog
+# Loads job_profiles.json once and caches all job-side NLP work
+# -------------------------------------------------------
+
+JOB_PROFILES_FILE = Path(__file__).parent / "job_profiles.json"
+
+# Bump whenever the compiled profile layout or job-side preprocessing changes
+CACHE_VERSION = 1
+
+# In-process memo: {profiles_path: ((st_mtime_ns, st_size), catalog)}
+_LOADED = {}
+
+
+def cache_path_for(profiles_path):
+    """
+    Compiled cache lives next to the JSON, e.g. job_profiles.cache.pkl
+    """
+    profiles_path = Path(profiles_path)
+    return profiles_path.with_name(profiles_path.stem + ".cache.pkl")
+
+
+def profile_problem(name, profile):
+    """
+    Returns a description of what is wrong with one raw profile, or None
+    if it is valid: {"skills": [str, ...], "job_description": str}
+    """
+    if not isinstance(profile, dict):
+        return f"profile '{name}' must be an object"
+    skills = profile.get("skills")
+    if not isinstance(skills, list) or not all(isinstance(s, str) for s in skills):
+        return f"profile '{name}' needs a 'skills' list of strings"
+    if not normalize_skills(skills):
+        return f"profile '{name}' has no non-empty skills"
+    if not isinstance(profile.get("job_description", ""), str):
+        return f"profile '{name}' has a non-string 'job_description'"
+    return None
+
+
+def validate_profiles(data):
+    """
+    Validates the raw job_profiles.json structure:
+    { "<name>": {"skills": [str, ...], "job_description": str}, ... }
+    Returns only the valid profiles; invalid ones are skipped with a warning
+    so one bad entry does not hide the rest.
+    Raises ValueError if the file is not a JSON object at all.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("job profiles must be a JSON object keyed by profile name")
+
+    valid = {}
+    for name, profile in data.items():
+        problem = profile_problem(name, profile)
+        if problem:
+            print(f"[WARN] Skipping job profile: {problem}")
+            continue
+        valid[name] = profile
+    return valid
+
+
+def _profile_key(profile):
+    """
+    Content hash of a single raw profile, used to reuse compiled entries
+    when only some profiles in the JSON changed.
+    """
+    payload = json.dumps(
+        [profile["skills"], profile.get("job_description", "")], sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def compile_profile(name, profile):
+    """
+    Runs all job-side preprocessing for one profile:
+    normalized skills, cleaned description and its TF-IDF tokens.
+    """
+    skills_norm = normalize_skills(profile["skills"])
+    job_description = profile.get("job_description", "")
+    job_clean = clean_and_lemmatize(job_text_for(job_description, skills_norm))
+
+    return {
+        "name": name,
+        "key": _profile_key(profile),
+        "skills": list(profile["skills"]),
+        "job_description": job_description,
+        "skills_norm": skills_norm,
+        "job_clean": job_clean,
+        "job_tokens": tfidf_tokens(job_clean),
+    }
+
+
+def _read_cache(cache_path):
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+        if cached.get("version") == CACHE_VERSION:
+            return cached
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        pass
+    return None
+
+
+def _write_cache(cache_path, payload):
+    # Write to a temp file first so a crash never leaves a half-written cache
+    tmp_path = str(cache_path) + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"[WARN] Could not write job profile cache: {cache_path}\nReason: {e}")
+
+
+def load_job_catalog(profiles_path=JOB_PROFILES_FILE):
+    """
+    Returns {profile_name: compiled_profile}.
+
+    While the JSON's mtime and size are unchanged the in-process memo is
+    returned without reading the file. Otherwise it is read and hashed, and
+    compiled profiles come from the on-disk cache when the hash matches.
+    If the JSON changed, only profiles whose content changed are recompiled.
+    A missing or unparsable JSON yields an empty catalog; invalid profiles
+    are skipped (see validate_profiles).
+    """
+    profiles_path = Path(profiles_path)
+    try:
+        stat = profiles_path.stat()
+    except OSError:
+        return {}
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    memo = _LOADED.get(str(profiles_path))
+    if memo and memo[0] == stamp:
+        return memo[1]
+
+    raw_bytes = profiles_path.read_bytes()
+    source_hash = hashlib.sha256(raw_bytes).hexdigest()
+
+    cache_path = cache_path_for(profiles_path)
+    cached = _read_cache(cache_path)
+
+    if cached and cached["source_hash"] == source_hash:
+        catalog = cached["profiles"]
+    else:
+        try:
+            data = validate_profiles(json.loads(raw_bytes.decode("utf-8")))
+        except ValueError as e:
+            print(f"[WARN] Could not load job profiles: {profiles_path}\nReason: {e}")
+            _LOADED[str(profiles_path)] = (stamp, {})
+            return {}
+
+        previous = cached["profiles"] if cached else {}
+        catalog = {}
+        for name, profile in data.items():
+            old = previous.get(name)
+            if old and old["key"] == _profile_key(profile):
+                catalog[name] = old
+            else:
+                catalog[name] = compile_profile(name, profile)
+
+        _write_cache(cache_path, {
+            "version": CACHE_VERSION,
+            "source_hash": source_hash,
+            "profiles": catalog,
+        })
+
+    _LOADED[str(profiles_path)] = (stamp, catalog)
+    return catalog
+
+
+# ------------------- TEST SECTION -------------------
+if __name__ == "__main__":
+    catalog = load_job_catalog()
+    print(f"\n--- Compiled {len(catalog)} job profiles ---\n")
+    for name, profile in catalog.items():
+        print(f"{name}: {len(profile['skills_norm'])} skills, {len(profile['job_tokens'])} job tokens")
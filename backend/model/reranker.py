@@ -0,0 +1,131 @@
+import json
+
+import numpy as np
+
+# -------------------------------------------------------
+# ⚖️ AI Resume Ranker - Instant Re-Ranking
+# Recombines cached component scores (skill / TF-IDF) without reprocessing
+# -------------------------------------------------------
+
+DEFAULT_SKILL_WEIGHT = 0.6
+DEFAULT_ML_WEIGHT = 0.4
+
+BLEND_FUNCTIONS = {
+    "weighted": "Weighted Average",
+    "geometric": "Weighted Geometric Mean (penalizes one weak score)",
+    "harmonic": "Weighted Harmonic Mean (strongly penalizes one weak score)",
+}
+
+# Per-candidate fields needed to re-rank; everything else is display data
+COMPONENT_FIELDS = ["file_name", "skill_score", "tfidf_score", "matched_skills", "missing_skills"]
+
+
+def normalize_weights(skill_weight, ml_weight):
+    """
+    Scales the two weights to sum to 1 (defaults if both are 0).
+    """
+    total = skill_weight + ml_weight
+    if total == 0:
+        return DEFAULT_SKILL_WEIGHT, DEFAULT_ML_WEIGHT
+    return skill_weight / total, ml_weight / total
+
+
+def blend_scores(skill_scores, tfidf_scores, skill_weight=DEFAULT_SKILL_WEIGHT,
+                 ml_weight=DEFAULT_ML_WEIGHT, blend="weighted"):
+    """
+    Vectorized final score (0-100, rounded to 2 decimals) for arrays of
+    skill and TF-IDF scores (both 0-100). All blends are means, so they
+    work directly on the 0-100 scale.
+    """
+    if blend not in BLEND_FUNCTIONS:
+        raise ValueError(f"Unknown blend '{blend}'. Choose from: {', '.join(BLEND_FUNCTIONS)}")
+
+    w_skill, w_ml = normalize_weights(skill_weight, ml_weight)
+    skill = np.asarray(skill_scores, dtype=float)
+    ml = np.asarray(tfidf_scores, dtype=float)
+
+    if blend == "weighted":
+        final = w_skill * skill + w_ml * ml
+    elif blend == "geometric":
+        final = np.power(skill, w_skill) * np.power(ml, w_ml)
+    else:
+        # a zero component with non-zero weight -> infinite denominator -> score 0
+        with np.errstate(divide="ignore"):
+            denom = np.zeros_like(skill)
+            if w_skill:
+                denom = denom + w_skill / skill
+            if w_ml:
+                denom = denom + w_ml / ml
+            final = 1 / denom
+
+    return np.round(final, 2)
+
+
+def rerank(results, skill_weight=DEFAULT_SKILL_WEIGHT, ml_weight=DEFAULT_ML_WEIGHT,
+           blend="weighted", must_have=None):
+    """
+    Recomputes final scores from cached component scores and returns a new,
+    re-sorted list of result dicts (inputs are not modified).
+
+    must_have: skills every returned candidate must have matched;
+    candidates missing any of them are dropped.
+    """
+    if not results:
+        return []
+
+    must_have = {s.strip().lower() for s in (must_have or []) if s.strip()}
+    if must_have:
+        results = [r for r in results if must_have.issubset(r["matched_skills"])]
+        if not results:
+            return []
+
+    skill = np.fromiter((r["skill_score"] for r in results), dtype=float, count=len(results))
+    ml = np.fromiter((r["tfidf_score"] for r in results), dtype=float, count=len(results))
+    final = blend_scores(skill, ml, skill_weight, ml_weight, blend)
+
+    order = np.argsort(-final, kind="stable")
+    return [{**results[i], "final_score": float(final[i])} for i in order]
+
+
+def save_component_scores(results, path, required_skills=None, job_description=""):
+    """
+    Persists per-candidate component scores (plus the job inputs they were
+    computed for) as JSON, so a ranking can be re-weighted later without
+    re-running PDF parsing / NLP.
+    """
+    payload = {
+        "required_skills": list(required_skills or []),
+        "job_description": job_description,
+        "candidates": [
+            {**{k: r[k] for k in COMPONENT_FIELDS},
+             "fuzzy_matches": r.get("fuzzy_matches", {}),
+             "duplicates": r.get("duplicates", [])}
+            for r in results
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+
+
+def load_component_scores(path):
+    """
+    Loads a file written by save_component_scores.
+    Returns (candidates, required_skills, job_description).
+    """
+    with open(path, encoding="utf-8") as f:
+        payload = json.load(f)
+    return payload["candidates"], payload["required_skills"], payload["job_description"]
+
+
+# ------------------- TEST SECTION -------------------
+if __name__ == "__main__":
+    sample = [
+        {"file_name": "a.pdf", "skill_score": 80.0, "tfidf_score": 10.0,
+         "matched_skills": ["python", "sql"], "missing_skills": ["excel"]},
+        {"file_name": "b.pdf", "skill_score": 50.0, "tfidf_score": 45.0,
+         "matched_skills": ["python"], "missing_skills": ["sql", "excel"]},
+    ]
+    for blend in BLEND_FUNCTIONS:
+        ranked = rerank(sample, 0.6, 0.4, blend)
+        print(blend, [(r["file_name"], r["final_score"]) for r in ranked])
+    print("must have sql:", [r["file_name"] for r in rerank(sample, must_have=["SQL"])])
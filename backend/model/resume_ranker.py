@@ -1,7 +1,9 @@
 import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
-from backend.model.skill_extractor import extract_skills_from_text
+from backend.model.dedup import choose_representative, find_duplicate_groups, minhash_signature, shingles
+from backend.model.reranker import blend_scores
+from backend.model.skill_extractor import extract_skills_by_source
 from backend.utils.pdf_parser import extract_text_from_pdf
 from backend.utils.text_preprocessing import clean_and_lemmatize
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -13,81 +15,194 @@ import numpy as np
 # (Skill-based + TF-IDF)
 # -------------------------
 
-def rank_resumes_combined(required_skills, job_description, resume_folder,
-                          skill_weight=0.6, ml_weight=0.4):
-    # safety: ensure weights sum to 1
-    total = skill_weight + ml_weight
-    if total == 0:
-        skill_weight, ml_weight = 0.6, 0.4
-    else:
-        skill_weight = skill_weight / total
-        ml_weight = ml_weight / total
+# Same tokenization TfidfVectorizer(stop_words="english") applies internally,
+# exposed so job-side tokens can be precomputed (see job_catalog.py)
+_TFIDF_ANALYZER = TfidfVectorizer(stop_words="english").build_analyzer()
 
-    results = []
-    resumes = [f for f in os.listdir(resume_folder) if f.lower().endswith(".pdf")]
 
-    if not resumes:
-        return []
+# Toggle debug printing (off by default: previews contain resume text)
+DEBUG_MODE = False
+
+# Tech fallback keywords to auto-detect if extractor misses them
+TECH_FALLBACK = {"jest", "supertest", "axios", "vite", "tailwind", "redux", "fastapi", "swagger", "postman"}
+
+
+def normalize_skills(skills):
+    """
+    Lowercases / strips a list of skills and drops empty entries.
+    """
+    return [s.strip().lower() for s in skills if s and s.strip()]
+
+
+def tfidf_tokens(text):
+    """
+    Tokenizes cleaned text exactly like the ranker's TF-IDF vectorizer.
+    """
+    return _TFIDF_ANALYZER(text or "")
+
+
+def job_text_for(job_description, required_skills_norm):
+    """
+    Text used as the job-side TF-IDF document: the description,
+    or the required skills when no description is given.
+    """
+    if job_description and job_description.strip():
+        return job_description.strip()
+    return " ".join(required_skills_norm)
 
-    # Normalize required skills
-    required_skills_norm = [s.strip().lower() for s in required_skills if s and s.strip()]
 
-    # Tech fallback keywords to auto-detect if extractor misses them
-    TECH_FALLBACK = {"jest", "supertest", "axios", "vite", "tailwind", "redux", "fastapi", "swagger", "postman"}
+def rank_resumes_combined(required_skills, job_description, resume_folder,
+                          skill_weight=0.6, ml_weight=0.4, job_profile=None,
+                          fuzzy_skills=False, dedupe=False, blend="weighted"):
+    """
+    Ranks every PDF in resume_folder against the job requirements.
+
+    With `fuzzy_skills=True`, misspelled / variant skills also count as
+    matched; their confidences are returned in 'fuzzy_matches'.
+
+    With `dedupe=True`, near-duplicate resumes (MinHash/LSH over text
+    shingles) are grouped before any NLP work; only one representative per
+    group is scored and the other copies are listed in its 'duplicates'.
+
+    Each result carries its component scores (skill_score, tfidf_score,
+    matched / missing skills), so weights and `blend` can later be changed
+    with reranker.rerank() without re-running this pipeline.
+
+    If `job_profile` (a compiled entry from job_catalog) is given, its
+    precomputed skills and job tokens are used and `required_skills` /
+    `job_description` are ignored, so no job-side NLP work is done.
+    """
+    resumes = [f for f in os.listdir(resume_folder) if f.lower().endswith(".pdf")]
 
-    for resume_file in resumes:
-        resume_path = os.path.join(resume_folder, resume_file)
+    if not resumes:
+        return []
 
-        # 1) Extract raw text from PDF
-        raw_text = extract_text_from_pdf(resume_path) or ""
-        # debug raw
+    # 1) Extract raw text from every PDF
+    candidates = [
+        {"file_name": f, "raw_text": extract_text_from_pdf(os.path.join(resume_folder, f)) or ""}
+        for f in resumes
+    ]
+
+    return rank_candidates(required_skills, job_description, candidates,
+                           skill_weight=skill_weight, ml_weight=ml_weight, job_profile=job_profile,
+                           fuzzy_skills=fuzzy_skills, dedupe=dedupe, blend=blend)
+
+
+def preprocess_resume(raw_text, fuzzy_skills=True):
+    """
+    Runs all per-resume NLP work once: cleaning / lemmatization, skill
+    extraction (with confidences) and TF-IDF tokenization.
+    The result is independent of the job, so it can be stored and reused
+    for any number of rankings (see candidate_pool.py).
+    """
+    # debug raw
+    if DEBUG_MODE:
         print("\n[DEBUG] RAW_TEXT preview (first 400 chars):\n", raw_text[:400])
 
-        # 2) Clean and lemmatize
-        resume_clean = clean_and_lemmatize(raw_text) or ""
+    # 2) Clean and lemmatize
+    resume_clean = clean_and_lemmatize(raw_text) or ""
+    if DEBUG_MODE:
         print("\n[DEBUG] CLEANED_TEXT preview (first 400 chars):\n", resume_clean[:400])
 
-        # 3) Extract skills found using your skill extractor
-        found_skills = extract_skills_from_text(resume_clean) or []
-        found_lower = [s.lower() for s in found_skills]
-        print("\n[DEBUG] FOUND_SKILLS from extractor:", found_skills)
+    # 3) Extract skills found using your skill extractor (exact and fuzzy kept apart)
+    exact_skills, fuzzy_found = extract_skills_by_source(resume_clean, fuzzy=fuzzy_skills, raw_text=raw_text)
+    if DEBUG_MODE:
+        print("\n[DEBUG] FOUND_SKILLS from extractor:", sorted(exact_skills), "fuzzy:", fuzzy_found)
+
+    # 4) Fallback: auto-detect tech keywords directly from raw_text and cleaned text
+    #    (handles cases where skill list missing or preprocessing dropped tokens)
+    raw_lower = raw_text.lower()
+    clean_lower = resume_clean.lower()
+
+    fallback_added = []
+    for kw in TECH_FALLBACK:
+        if kw not in exact_skills and (kw in raw_lower or kw in clean_lower):
+            exact_skills.add(kw)
+            fuzzy_found.pop(kw, None)
+            fallback_added.append(kw)
+
+    if DEBUG_MODE and fallback_added:
+        print("[DEBUG] Fallback auto-added keywords:", fallback_added)
+
+    return {
+        "resume_clean": resume_clean,
+        "exact_skills": sorted(exact_skills),
+        "fuzzy_skills": fuzzy_found,
+        "tokens": tfidf_tokens(resume_clean),
+        "minhash": minhash_signature(shingles(raw_text)),
+    }
+
+
+def rank_candidates(required_skills, job_description, candidates,
+                    skill_weight=0.6, ml_weight=0.4, job_profile=None,
+                    fuzzy_skills=False, dedupe=False, blend="weighted"):
+    """
+    Ranks candidate dicts ({"file_name", "raw_text"}, optionally already
+    carrying the fields from preprocess_resume) against the job requirements.
+    Candidates that are not preprocessed yet are preprocessed here, after
+    deduplication. Options are the same as for rank_resumes_combined.
+    """
+    if not candidates:
+        return []
+
+    # Normalize required skills
+    if job_profile is not None:
+        required_skills_norm = job_profile["skills_norm"]
+    else:
+        required_skills_norm = normalize_skills(required_skills)
+
+    # 1b) Near-duplicate detection: score one representative per group
+    raw_texts = {c["file_name"]: c["raw_text"] for c in candidates}
+    duplicates_of = {}
+    if dedupe:
+        # Preprocessed (pool) candidates carry their MinHash signature already
+        signatures = {c["file_name"]: c["minhash"] for c in candidates if "minhash" in c}
+        for group in find_duplicate_groups(raw_texts, signatures=signatures):
+            rep = choose_representative(group, raw_texts)
+            duplicates_of[rep] = [f for f in group if f != rep]
+    skipped = {f for copies in duplicates_of.values() for f in copies}
 
-        # 4) Fallback: auto-detect tech keywords directly from raw_text and cleaned text
-        #    (handles cases where skill list missing or preprocessing dropped tokens)
-        raw_lower = raw_text.lower()
-        clean_lower = resume_clean.lower()
+    results = []
+    resume_tokens = []
+    for candidate in candidates:
+        resume_file = candidate["file_name"]
+        if resume_file in skipped:
+            continue
 
-        fallback_added = []
-        for kw in TECH_FALLBACK:
-            if kw not in found_lower and (kw in raw_lower or kw in clean_lower):
-                found_lower.append(kw)
-                fallback_added.append(kw)
+        if "exact_skills" not in candidate:
+            candidate = {**candidate, **preprocess_resume(candidate["raw_text"], fuzzy_skills)}
 
-        if fallback_added:
-            print("[DEBUG] Fallback auto-added keywords:", fallback_added)
+        # Preprocessed pools always carry fuzzy matches; count them only if asked
+        fuzzy_found = candidate["fuzzy_skills"] if fuzzy_skills else {}
+        found = set(candidate["exact_skills"]) | set(fuzzy_found)
 
         # 5) Matched / missing against required list
-        matched = [s for s in required_skills_norm if s in found_lower]
-        missing = [s for s in required_skills_norm if s not in found_lower]
+        matched = [s for s in required_skills_norm if s in found]
+        missing = [s for s in required_skills_norm if s not in found]
 
         skill_score = round((len(matched) / len(required_skills_norm)) * 100, 2) if required_skills_norm else 0.0
 
+        resume_tokens.append(candidate["tokens"])
         results.append({
             "file_name": resume_file,
-            "resume_text": resume_clean,
             "skill_score": skill_score,
             "matched_skills": matched,
-            "missing_skills": missing
+            "missing_skills": missing,
+            "fuzzy_matches": {s: fuzzy_found[s] for s in matched if s in fuzzy_found},
+            "duplicates": duplicates_of.get(resume_file, []),
         })
 
     # ---------------- TF-IDF (semantic) processing ----------------
-    job_text = job_description.strip() if (job_description and job_description.strip()) else " ".join(required_skills_norm)
-    job_clean = clean_and_lemmatize(job_text)
+    if job_profile is not None:
+        job_tokens = job_profile["job_tokens"]
+    else:
+        job_tokens = tfidf_tokens(clean_and_lemmatize(job_text_for(job_description, required_skills_norm)))
 
-    docs = [job_clean] + [r["resume_text"] for r in results]
+    docs = [job_tokens] + resume_tokens
 
     try:
-        vectorizer = TfidfVectorizer(stop_words="english", max_features=5000)
+        # Documents are pre-tokenized (stop words already removed by tfidf_tokens)
+        vectorizer = TfidfVectorizer(analyzer=_identity, max_features=5000)
         tfidf_matrix = vectorizer.fit_transform(docs)
         job_vec = tfidf_matrix[0]
         resume_vecs = tfidf_matrix[1:]
@@ -96,23 +211,24 @@ def rank_resumes_combined(required_skills, job_description, resume_folder,
         print("[DEBUG] TF-IDF error:", e)
         tfidf_scores = np.zeros(len(results))
 
-    # Combine
+    # Combine (same vectorized blend the re-ranker uses)
     for idx, r in enumerate(results):
-        ml_score = round(float(tfidf_scores[idx]), 2) if len(tfidf_scores) > idx else 0.0
-        final_score = round((skill_weight * r["skill_score"] + ml_weight * ml_score), 2)
-        r["tfidf_score"] = ml_score
-        r["final_score"] = final_score
+        r["tfidf_score"] = round(float(tfidf_scores[idx]), 2) if len(tfidf_scores) > idx else 0.0
 
-    results.sort(key=lambda x: x["final_score"], reverse=True)
+    final_scores = blend_scores([r["skill_score"] for r in results], [r["tfidf_score"] for r in results],
+                                skill_weight, ml_weight, blend)
+    for r, final_score in zip(results, final_scores):
+        r["final_score"] = float(final_score)
 
-    # Cleanup
-    for r in results:
-        if "resume_text" in r:
-            del r["resume_text"]
+    results.sort(key=lambda x: x["final_score"], reverse=True)
 
     return results
 
 
+def _identity(tokens):
+    return tokens
+
+
 
 # ---------------- TEST / DEMO ----------------
 if __name__ == "__main__":
@@ -2,7 +2,9 @@ import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 import re
+from functools import lru_cache
 from pathlib import Path
+from backend.model.fuzzy_skill_index import FuzzySkillIndex
 from backend.utils.text_preprocessing import apply_synonyms, clean_and_lemmatize
 
 # -------------------------------------------------------
@@ -37,13 +39,19 @@ def load_skills():
     return skills
 
 
-def extract_skills_from_text(text):
+@lru_cache(maxsize=1)
+def get_fuzzy_index():
     """
-    Extracts skills from text using:
-    - NLP cleaning
-    - Synonym normalization
-    - Acronym and tech keyword handling
-    - Regex and fallback scanning
+    Builds the fuzzy n-gram index over skills_list.txt once per process.
+    Section header lines ('# ---- ... ----') are not skills and are skipped.
+    """
+    return FuzzySkillIndex(s for s in load_skills() if not s.startswith("#"))
+
+
+def normalize_for_matching(text):
+    """
+    Cleans text and applies synonym / acronym normalization.
+    Returns (text_lower, all_text_no_punct) used by the matchers.
     """
 
     # Step 1️⃣: Clean + normalize
@@ -51,14 +59,10 @@ def extract_skills_from_text(text):
     normalized_text = apply_synonyms(cleaned_text)
     text_lower = normalized_text.lower()
 
-    # Step 2️⃣: Load known skills
-    skills = load_skills()
-    found = set()
-
-    # Step 3️⃣: Pre-compile regex for speed
+    # Step 2️⃣: Pre-compile regex for speed
     all_text_no_punct = re.sub(r'[^a-z0-9]', '', text_lower)
 
-    # Step 4️⃣: Smart acronym handling — merge IAM, CI/CD, JWT, REST, etc.
+    # Step 3️⃣: Smart acronym handling — merge IAM, CI/CD, JWT, REST, etc.
     # Replace possible variants to match consistently
     text_lower = re.sub(r"\bi am\b", "iam", text_lower)
     text_lower = re.sub(r"ci[\s\-\/]?cd", "ci cd", text_lower)
@@ -69,7 +73,18 @@ def extract_skills_from_text(text):
     if DEBUG_MODE:
         print("\n--- DEBUG CLEANED TEXT PREVIEW ---\n", text_lower[:800])
 
-    # Step 5️⃣: Pattern matching
+    return text_lower, all_text_no_punct
+
+
+def match_skills_exact(text_lower, all_text_no_punct):
+    """
+    Exact matching stage: regex patterns, compact substrings and
+    the tech keyword fallback. Returns a set of skills.
+    """
+    skills = load_skills()
+    found = set()
+
+    # Step 4️⃣: Pattern matching
     for skill in skills:
         skill = skill.strip().lower()
         tokens = skill.split()
@@ -88,7 +103,7 @@ def extract_skills_from_text(text):
             if compact_skill in all_text_no_punct:
                 found.add(skill)
 
-    # Step 6️⃣: Fallback detection for modern tools missed by skills list
+    # Step 5️⃣: Fallback detection for modern tools missed by skills list
     TECH_FALLBACK = [
     "axios", "jest", "supertest", "vite", "tailwind", "redux",
     "swagger", "fastapi", "postman", "iam", "sns", "sqs",
@@ -101,8 +116,55 @@ def extract_skills_from_text(text):
         if (kw in text_lower or kw.replace(" ", "") in all_text_no_punct):
             found.add(kw)
 
-    # Step 7️⃣: Return sorted list
-    found_sorted = sorted(found)
+    return found
+
+
+def extract_skills_by_source(text, fuzzy=True, min_confidence=0.8, raw_text=None):
+    """
+    Runs the matching stages and keeps their results apart.
+    Returns (exact, fuzzy_found): the set of skills found by the exact
+    matcher and {skill: confidence} for skills only the fuzzy index found.
+
+    The fuzzy stage scans un-lemmatized text (`raw_text`, default `text`),
+    since lemmatization drops tokens like 'tensorflow2' and alters typos.
+    """
+    text_lower, all_text_no_punct = normalize_for_matching(text)
+    exact = match_skills_exact(text_lower, all_text_no_punct)
+
+    fuzzy_found = {}
+    if fuzzy:
+        fuzzy_text = apply_synonyms(raw_text if raw_text is not None else text)
+        fuzzy_found = get_fuzzy_index().match_text(fuzzy_text, exclude=exact, min_confidence=min_confidence)
+        if DEBUG_MODE and fuzzy_found:
+            print("\n[DEBUG] Fuzzy Skill Matches:", fuzzy_found)
+
+    return exact, fuzzy_found
+
+
+def extract_skills_with_confidence(text, fuzzy=True, min_confidence=0.8, raw_text=None):
+    """
+    Like extract_skills_from_text, but returns {skill: confidence}.
+    Exact matches have confidence 1.0; with `fuzzy=True`, misspelled or
+    variant skills ("Pyhton", "Kubernates", "Tensorflow2") found through
+    the fuzzy index are added with confidence = 1 - edits / length
+    (always below 1.0). Use extract_skills_by_source to get the two apart.
+    """
+    exact, fuzzy_found = extract_skills_by_source(text, fuzzy, min_confidence, raw_text)
+    return {**fuzzy_found, **{skill: 1.0 for skill in exact}}
+
+
+def extract_skills_from_text(text, fuzzy=False):
+    """
+    Extracts skills from text using:
+    - NLP cleaning
+    - Synonym normalization
+    - Acronym and tech keyword handling
+    - Regex and fallback scanning
+    - Optional fuzzy matching for misspelled skills (fuzzy=True)
+    """
+
+    # Step 6️⃣: Return sorted list
+    found_sorted = sorted(extract_skills_with_confidence(text, fuzzy=fuzzy))
 
     if DEBUG_MODE:
         print("\n[DEBUG] Extracted Skills:", found_sorted)
@@ -119,3 +181,6 @@ if __name__ == "__main__":
     """
     print("\n--- Extracted Skills ---\n")
     print(extract_skills_from_text(sample_text))
+
+    print("\n--- Extracted Skills (fuzzy, with confidence) ---\n")
+    print(extract_skills_with_confidence("Worked with Pyhton, Kubernates and Tensorflow2 on ML pipelines."))
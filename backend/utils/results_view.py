@@ -0,0 +1,139 @@
+import csv
+import io
+
+# -------------------------------------------------------
+# 📊 AI Resume Ranker - Results View Helpers
+# Filtering, sorting, paging and export for large rankings
+# -------------------------------------------------------
+
+# Columns shown in the results table / written to exports (in order)
+RESULT_COLUMNS = [
+    "rank", "file_name", "final_score", "skill_score", "tfidf_score",
+    "matched_skills", "missing_skills", "duplicates",
+]
+
+SORT_OPTIONS = {
+    "Final Score": "final_score",
+    "Skill Score": "skill_score",
+    "TF-IDF Score": "tfidf_score",
+    "File Name": "file_name",
+}
+
+# Optional Parquet support (pyarrow is not part of requirements.txt)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    pa = pq = None
+    PARQUET_AVAILABLE = False
+
+
+def add_ranks(results):
+    """
+    Attach a 1-based 'rank' to every result (results are expected
+    to be sorted by final score already, as returned by the ranker).
+    """
+    for i, r in enumerate(results, start=1):
+        r["rank"] = i
+    return results
+
+
+def filter_results(results, name_query="", min_score=0.0):
+    """
+    Filters results by file name substring and minimum final score.
+    """
+    query = (name_query or "").strip().lower()
+
+    filtered = []
+    for r in results:
+        if query and query not in r["file_name"].lower():
+            continue
+        if r["final_score"] < min_score:
+            continue
+        filtered.append(r)
+    return filtered
+
+
+def sort_results(results, sort_key="final_score", descending=True):
+    """
+    Returns a new list sorted by the given result field.
+    """
+    if sort_key == "file_name":
+        return sorted(results, key=lambda r: r["file_name"].lower(), reverse=descending)
+    return sorted(results, key=lambda r: r[sort_key], reverse=descending)
+
+
+def paginate(results, page, page_size):
+    """
+    Returns (page_rows, total_pages) for a 1-based page number.
+    Out-of-range pages are clamped to the valid range.
+    """
+    total_pages = max(1, -(-len(results) // page_size))
+    page = min(max(1, page), total_pages)
+    start = (page - 1) * page_size
+    return results[start:start + page_size], total_pages
+
+
+def to_table_rows(results):
+    """
+    Flattens results into table-friendly rows (skill lists joined as text).
+    Only call this on the current page, never on the full ranking.
+    """
+    return [_table_row(r) for r in results]
+
+
+def _table_row(result):
+    row = {col: result.get(col) for col in RESULT_COLUMNS}
+    row["matched_skills"] = ", ".join(result["matched_skills"])
+    row["missing_skills"] = ", ".join(result["missing_skills"])
+    row["duplicates"] = ", ".join(result.get("duplicates", []))
+    return row
+
+
+def top_n(results, n=20):
+    """
+    Returns the n best results by final score.
+    """
+    return sorted(results, key=lambda r: r["final_score"], reverse=True)[:n]
+
+
+def export_csv(results):
+    """
+    Writes the ranking as CSV with csv.DictWriter (no DataFrame) and returns
+    the encoded bytes. The file is built in memory, since st.download_button
+    needs the full payload; app.py only calls this on demand.
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=RESULT_COLUMNS)
+    writer.writeheader()
+    writer.writerows(_table_row(r) for r in results)
+    return buffer.getvalue().encode("utf-8")
+
+
+def export_parquet(results, chunk_size=5000):
+    """
+    Writes the ranking as Parquet, one row group per `chunk_size` results,
+    and returns the encoded bytes. Requires pyarrow.
+    """
+    if not PARQUET_AVAILABLE:
+        raise RuntimeError("Parquet export requires the 'pyarrow' package.")
+
+    schema = pa.schema([
+        ("rank", pa.int64()),
+        ("file_name", pa.string()),
+        ("final_score", pa.float64()),
+        ("skill_score", pa.float64()),
+        ("tfidf_score", pa.float64()),
+        ("matched_skills", pa.list_(pa.string())),
+        ("missing_skills", pa.list_(pa.string())),
+        ("duplicates", pa.list_(pa.string())),
+    ])
+
+    sink = pa.BufferOutputStream()
+    with pq.ParquetWriter(sink, schema) as writer:
+        for start in range(0, len(results), chunk_size):
+            chunk = results[start:start + chunk_size]
+            columns = {name: [r.get(name) for r in chunk] for name in schema.names}
+            writer.write_table(pa.table(columns, schema=schema))
+    return sink.getvalue().to_pybytes()